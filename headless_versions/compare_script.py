@@ -1,13 +1,104 @@
-import subprocess  # Para executar processos
-import pandas as pd  # Para manipulação e análise de dados
-import matplotlib.pyplot as plt  # Para criação de gráficos
+import importlib.util  # Para importar os scripts comparados como módulos
+import numpy as np  # Para cálculos vetorizados das posições das barras
 import argparse  # Para processar argumentos da linha de comando
 import os  # Para operações com sistema de arquivos
+import csv  # Para gravar os resultados no CSV
+import multiprocessing  # Para o contexto e o índice de cada worker
 # Para execução paralela
-from concurrent.futures import ProcessPoolExecutor, as_completed
-import random  # Para geração de números aleatórios
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime  # Para manipulação de datas/horas
 import shutil  # Para operações avançadas com arquivos (como cópia)
+import tempfile  # Para cópias gravadas primeiro em um arquivo temporário
+from pathlib import Path  # Para gravar as listas de seeds de uma só vez
+import hashlib  # Para identificar gráficos já gerados (cache)
+import traceback  # Para exibir falhas dos scripts sem interromper a comparação
+# Para manter os scripts carregados em cada worker e fixar argumentos
+from functools import lru_cache, partial
+
+# pandas e matplotlib são importados apenas nas funções que os usam:
+# execuções com --no-plot não pagam o custo dessas importações
+
+# Colunas numéricas do registro usado para acumular os resultados em memória
+# durante a execução (mesmas colunas, na mesma ordem, do CSV gravado pelos
+# scripts comparados); a coluna Script é acrescentada por result_record
+RESULT_FIELDS = [
+    ('Seed', 'i8'),
+    ('Score', 'i4'),
+    ('Steps', 'i4'),
+    ('Deliveries', 'i4'),
+]
+
+# Tipos das colunas do CSV de resultados (evita a inferência de tipos na leitura)
+RESULT_DTYPES = {
+    'Script': 'category',  # Poucos nomes repetidos em muitas linhas
+    'Seed': 'int64',
+    'Score': 'float32',
+    'Steps': 'float32',
+    'Deliveries': 'float32',
+}
+
+# Margens dos gráficos (fração da figura de 12x6 polegadas)
+PLOT_MARGINS = {'left': 0.07, 'right': 0.98, 'bottom': 0.3, 'top': 0.88}
+
+# Resolução dos PNGs de análise (--plots advanced)
+ANALYSIS_PLOT_DPI = 150
+
+# Estilo dos gráficos de análise (fundo branco com grade): as mesmas
+# configurações dos estilos seaborn-v0_8 e seaborn-v0_8-whitegrid do
+# matplotlib, aplicadas diretamente sem carregar as folhas de estilo
+ANALYSIS_PLOT_RC = {
+    'axes.axisbelow': True,
+    'axes.edgecolor': '.8',
+    'axes.grid': True,
+    'axes.labelcolor': '.15',
+    'axes.labelsize': 11,
+    'axes.linewidth': 1,
+    'axes.prop_cycle': "cycler('color', ['#4C72B0', '#55A868', '#C44E52', "
+                       "'#8172B2', '#CCB974', '#64B5CD'])",
+    'axes.titlesize': 12,
+    'figure.figsize': (8, 5.5),
+    'font.sans-serif': ['Arial', 'Liberation Sans', 'DejaVu Sans',
+                        'Bitstream Vera Sans', 'sans-serif'],
+    'grid.color': '.8',
+    'grid.linewidth': 1,
+    'image.cmap': 'Greys',
+    'legend.fontsize': 10,
+    'legend.frameon': False,
+    'lines.linewidth': 1.75,
+    'lines.markeredgewidth': 0,
+    'lines.markersize': 7,
+    'lines.solid_capstyle': 'round',
+    'patch.facecolor': '#4C72B0',
+    'patch.linewidth': 0.3,
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'xtick.labelsize': 10,
+    'xtick.major.pad': 7,
+    'xtick.major.size': 0,
+    'xtick.major.width': 1,
+    'xtick.minor.size': 0,
+    'xtick.minor.width': 0.5,
+    'ytick.color': '.15',
+    'ytick.labelsize': 10,
+    'ytick.major.pad': 7,
+    'ytick.major.size': 0,
+    'ytick.major.width': 1,
+    'ytick.minor.size': 0,
+    'ytick.minor.width': 0.5,
+}
+
+# Número máximo de pontos desenhados no gráfico de dispersão (acima disso, uma
+# amostra de cada script é desenhada; a regressão usa sempre todos os dados)
+SCATTER_MAX_POINTS = 2000
+
+# Cache dos gráficos já gerados, compartilhado entre execuções (um gráfico com
+# os mesmos dados não é renderizado de novo)
+PLOT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache",
+                              "delivery-bot-plots")
+
+# ioctl do Linux que cria um reflink (cópia que compartilha os blocos do
+# arquivo original até que um dos dois seja alterado)
+FICLONE = 0x40049409
 
 
 def create_unique_results_dir(base_dir="results"):
@@ -29,25 +120,295 @@ def create_unique_results_dir(base_dir="results"):
   return results_dir
 
 
-def run_script(script, seed, output_csv):
+def write_seeds(path, seeds):
+  """
+  Grava uma seed por linha com uma única escrita binária.
+
+  Parâmetros:
+      path (str): Arquivo de destino
+      seeds (list): Seeds (inteiros) a serem gravadas
+  """
+  Path(path).write_bytes(b"".join(b"%d\n" % seed for seed in seeds))
+
+
+def result_record(scripts):
+  """
+  Monta o registro dos resultados, com a coluna Script larga o bastante
+  para o maior nome de script (um nome truncado não corresponderia ao do
+  CSV ao retomar uma execução).
+
+  Parâmetros:
+      scripts (list): Lista de caminhos para os scripts comparados
+
+  Retorna:
+      np.dtype: Registro com as colunas do CSV de resultados
+  """
+  width = max((len(os.path.basename(script)) for script in scripts),
+              default=1)
+  return np.dtype(RESULT_FIELDS + [('Script', f'U{width}')])
+
+
+def parse_seeds(text):
+  """
+  Converte a lista de seeds do --seeds, recusando valores que não cabem na
+  coluna Seed (int64) dos resultados.
+
+  Parâmetros:
+      text (str): Seeds separadas por vírgula
+
+  Retorna:
+      list: Seeds como inteiros
+  """
+  limits = np.iinfo(np.int64)
+  seeds = []
+  for item in text.split(','):
+    try:
+      seed = int(item)
+    except ValueError:
+      raise argparse.ArgumentTypeError(f"invalid seed: {item!r}")
+    if not limits.min <= seed <= limits.max:
+      raise argparse.ArgumentTypeError(
+          f"seed {seed} is outside the int64 range "
+          f"[{limits.min}, {limits.max}]")
+    seeds.append(seed)
+  return seeds
+
+
+@lru_cache(maxsize=None)
+def load_script(script):
   """
-  Executa um script Python individual com os parâmetros especificados.
+  Importa um script de comparação como módulo, uma única vez por processo.
+
+  Parâmetros:
+      script (str): Caminho para o script Python a ser importado
+
+  Retorna:
+      module: Módulo carregado (com a classe Maze do script)
+  """
+  # Usa o nome do arquivo como nome do módulo para que __file__ continue
+  # apontando para o script original (usado na coluna Script do CSV)
+  module_name = os.path.splitext(os.path.basename(script))[0]
+  spec = importlib.util.spec_from_file_location(
+      module_name, os.path.abspath(script))
+  module = importlib.util.module_from_spec(spec)
+  spec.loader.exec_module(module)
+  return module
+
+
+def pin_to_core():
+  """
+  Fixa o processo worker atual em um único núcleo (apenas Linux), evitando
+  que o sistema o migre entre núcleos no meio da simulação.
+  """
+  if not hasattr(os, 'sched_setaffinity'):
+    return
+  identity = multiprocessing.current_process()._identity
+  if not identity:
+    return
+  cores = sorted(os.sched_getaffinity(0))
+  os.sched_setaffinity(0, {cores[(identity[0] - 1) % len(cores)]})
+
+
+def available_cores():
+  """
+  Retorna o número de núcleos que este processo pode usar (respeita a
+  afinidade definida por taskset/cgroups no Linux).
+  """
+  if hasattr(os, 'sched_getaffinity'):
+    return len(os.sched_getaffinity(0))
+  return os.cpu_count() or 1
+
+
+def worker_context():
+  """
+  Retorna o contexto de multiprocessing usado pelo pool de workers.
+
+  Onde disponível (Linux/macOS), usa forkserver: os workers são criados a
+  partir de um processo servidor enxuto, com o numpy já importado, em vez de
+  copiar o processo principal (que pode já ter pandas e matplotlib
+  carregados e threads em execução).
+
+  Retorna:
+      BaseContext: Contexto forkserver, ou None para usar o padrão do sistema
+  """
+  if 'forkserver' not in multiprocessing.get_all_start_methods():
+    return None
+  context = multiprocessing.get_context('forkserver')
+  context.set_forkserver_preload(['numpy'])
+  return context
+
+
+def init_worker(scripts):
+  """
+  Inicializa um processo worker: fixa-o em um núcleo e importa todos os
+  scripts comparados uma única vez antes da primeira tarefa.
+
+  Parâmetros:
+      scripts (list): Lista de caminhos para os scripts comparados
+  """
+  pin_to_core()
+  for script in scripts:
+    load_script(script)
+
+
+def run_script(script, seed):
+  """
+  Executa um script individual dentro do próprio processo worker.
 
   Parâmetros:
       script (str): Caminho para o script Python a ser executado
       seed (int): Semente aleatória para reproduzibilidade
-      output_csv (str): Arquivo CSV onde os resultados serão salvos
+
+  Retorna:
+      tuple: Linha de resultado no formato de result_record, ou None se o
+          script falhar (como um subprocesso com erro, a falha é exibida e
+          as demais execuções continuam)
   """
-  # Executa o script como um subprocesso com os parâmetros especificados
-  subprocess.run([
-      "python3", script,  # Comando para executar o script
-      "--seed", str(seed),  # Passa a semente aleatória
-      "--headless",  # Flag para modo headless (sem interface gráfica)
-      "--output", output_csv  # Arquivo de saída para os resultados
-  ])
+  module = load_script(script)
+  # Todos os scripts headless expõem a mesma interface:
+  # Maze(seed, headless, output_file).game_loop(). O CSV gravado pelo próprio
+  # script é descartado (os.devnull); os resultados são lidos direto do Maze
+  # e devolvidos ao processo principal pelo pool
+  try:
+    maze = module.Maze(seed=seed, headless=True, output_file=os.devnull)
+    maze.game_loop()
+  except Exception:
+    print(f"Error running {script} with seed {seed}:\n"
+          f"{traceback.format_exc()}", flush=True)
+    return None
+  return (seed, maze.score, maze.steps, maze.num_deliveries,
+          os.path.basename(script))
+
+
+def save_results(rows, output_csv):
+  """
+  Grava as linhas de resultado no CSV final, acrescentando-as às linhas de
+  uma execução anterior quando o arquivo já existe.
+
+  Parâmetros:
+      rows (np.ndarray): Array estruturado com registros de result_record
+      output_csv (str): Arquivo CSV final com todos os resultados
+  """
+  if len(rows) == 0:
+    return
+  # Apenas o processo principal grava o CSV, de uma só vez e sem passar pelo
+  # pandas (os registros já estão na ordem das colunas do CSV)
+  write_header = not os.path.exists(output_csv)
+  with open(output_csv, 'a', newline='') as f:
+    writer = csv.writer(f, lineterminator='\n')
+    if write_header:
+      writer.writerow(rows.dtype.names)
+    writer.writerows(rows.tolist())
+
+
+def read_results(csv_file, columns):
+  """
+  Lê colunas do CSV de resultados já com os tipos de RESULT_DTYPES. Usa o
+  leitor multithread do pyarrow quando ele estiver instalado (é opcional).
+
+  Parâmetros:
+      csv_file (str): Arquivo CSV com os resultados
+      columns (list): Colunas a serem lidas
+
+  Retorna:
+      DataFrame: Colunas lidas do CSV
+  """
+  import pandas as pd  # Para ler o CSV
+  dtype = {column: RESULT_DTYPES[column] for column in columns}
+  if importlib.util.find_spec('pyarrow') is not None:
+    return pd.read_csv(csv_file, usecols=columns,
+                       engine='pyarrow').astype(dtype)
+  return pd.read_csv(csv_file, usecols=columns, dtype=dtype, engine='c',
+                     memory_map=True)
+
+
+def results_frame(rows, output_csv):
+  """
+  Monta o DataFrame com todos os resultados da execução a partir das linhas
+  em memória, somando as de uma execução anterior quando o CSV já existe.
+
+  Parâmetros:
+      rows (np.ndarray): Array estruturado com registros de result_record
+      output_csv (str): Arquivo CSV final com todos os resultados
+
+  Retorna:
+      DataFrame: Resultados com os tipos de RESULT_DTYPES
+  """
+  import pandas as pd  # Para manipulação e análise de dados
+  df = pd.DataFrame(rows)
+  if os.path.exists(output_csv):
+    previous = read_results(output_csv, list(RESULT_DTYPES))
+    df = pd.concat([previous, df], ignore_index=True)
+  return df.astype(RESULT_DTYPES)
+
+
+def completed_tasks(output_csv):
+  """
+  Lista os pares (script, seed) que já possuem resultado no CSV.
+
+  Parâmetros:
+      output_csv (str): Arquivo CSV com os resultados
+
+  Retorna:
+      set: Pares (nome do script, seed) já executados
+  """
+  if not os.path.exists(output_csv):
+    return set()
+  df = read_results(output_csv, ['Script', 'Seed'])
+  return set(zip(df['Script'], df['Seed']))
 
 
-def run_comparison(scripts, num_runs, output_csv, custom_seeds=None):
+def clone_file(source, destination):
+  """
+  Copia um arquivo para um temporário na pasta de destino e só então o move
+  para o lugar (os.replace): uma cópia que falha ou é interrompida nunca
+  trunca nem deixa pela metade o arquivo de destino. Em sistemas de arquivos
+  com suporte (btrfs, XFS), a cópia é um reflink e nenhum dado é copiado;
+  nos demais, é feita uma cópia comum.
+
+  Parâmetros:
+      source (str): Arquivo de origem
+      destination (str): Caminho final da cópia
+  """
+  with open(source, 'rb') as src:
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(destination) or '.', suffix='.tmp')
+    try:
+      with os.fdopen(fd, 'wb') as dst:
+        try:
+          import fcntl  # Apenas em sistemas Unix
+          fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except (ImportError, OSError):
+          shutil.copyfileobj(src, dst)
+      shutil.copystat(source, temp_path)
+      os.replace(temp_path, destination)
+    except BaseException:
+      try:
+        os.remove(temp_path)
+      except OSError:
+        pass
+      raise
+
+
+def copy_script(script, scripts_dir):
+  """
+  Copia um script comparado para a pasta da execução (ver clone_file).
+
+  Parâmetros:
+      script (str): Caminho do script
+      scripts_dir (str): Pasta de destino
+  """
+  destination = os.path.join(scripts_dir, os.path.basename(script))
+  # O script já é a cópia arquivada (por exemplo, ao rodar de novo os
+  # scripts de scripts_compared com --resume): não há nada a copiar
+  if os.path.exists(destination) and os.path.samefile(script, destination):
+    return
+  clone_file(script, destination)
+
+
+def run_comparison(scripts, num_runs, output_csv, custom_seeds=None,
+                   resume_dir=None, meta_seed=None, plot=True,
+                   max_workers=None, plots='basic'):
   """
   Executa a comparação entre múltiplos scripts em paralelo.
 
@@ -56,41 +417,114 @@ def run_comparison(scripts, num_runs, output_csv, custom_seeds=None):
       num_runs (int): Número de execuções quando usando seeds aleatórias
       output_csv (str): Nome do arquivo CSV de saída
       custom_seeds (list, opcional): Lista de seeds personalizadas para usar
+      resume_dir (str, opcional): Diretório de uma execução anterior a ser
+          retomada (pares script/seed já concluídos não são executados)
+      meta_seed (int, opcional): Seed do gerador que sorteia as seeds
+          aleatórias (permite reproduzir o experimento inteiro)
+      plot (bool): Se False, apenas grava o CSV, sem gerar os gráficos
+      max_workers (int, opcional): Número de processos paralelos (padrão: um
+          por núcleo disponível, sem passar do número de tarefas)
+      plots (str): Conjunto de gráficos gerado ('basic' ou 'advanced')
   """
-  # Cria um diretório único para os resultados desta execução
-  results_dir = create_unique_results_dir()
-  print(f"All results will be saved in: {results_dir}")
+  if resume_dir:
+    # Reaproveita o diretório de uma execução anterior
+    results_dir = resume_dir
+    print(f"Resuming previous run in: {results_dir}")
+  else:
+    # Cria um diretório único para os resultados desta execução
+    results_dir = create_unique_results_dir()
+    print(f"All results will be saved in: {results_dir}")
 
   # Cria o caminho completo para o arquivo CSV de saída
   full_output_csv = os.path.join(results_dir, output_csv)
+  seeds_path = os.path.join(results_dir, "seeds_used.txt")
+
+  # Seeds já registradas pela execução retomada (o CSV e os gráficos
+  # continuam cobrindo todas elas)
+  previous_seeds = []
+  if resume_dir and os.path.exists(seeds_path):
+    with open(seeds_path) as f:
+      previous_seeds = [int(line) for line in f if line.strip()]
 
   # Determina as seeds a serem usadas
   if custom_seeds:
     seeds = custom_seeds
     print(f"Using custom seeds: {seeds}")
+  elif previous_seeds:
+    # Retoma com as mesmas seeds da execução anterior
+    seeds = previous_seeds
+    print(f"Using seeds from previous run: {seeds}")
   else:
-    # Gera seeds aleatórias se nenhuma for fornecida
-    seeds = [random.randint(0, 10**16) for _ in range(num_runs)]
-    print(f"Generated random seeds: {seeds}")
+    # Gera seeds aleatórias se nenhuma for fornecida, todas de uma vez e a
+    # partir de uma meta-seed registrada para reproduzir o experimento
+    if meta_seed is None:
+      meta_seed = np.random.SeedSequence().entropy
+    rng = np.random.default_rng(meta_seed)
+    seeds = rng.integers(0, 10**16, size=num_runs, endpoint=True,
+                         dtype=np.int64).tolist()
+    write_seeds(os.path.join(results_dir, "meta_seed.txt"), [meta_seed])
+    print(f"Generated random seeds (meta-seed {meta_seed}): {seeds}")
 
-  # Salva as seeds usadas em um arquivo para referência futura
-  with open(os.path.join(results_dir, "seeds_used.txt"), "w") as f:
-    f.write("\n".join(map(str, seeds)) + "\n")
+  # Remove seeds repetidas (mantendo a ordem), pois cada par (script, seed)
+  # é determinístico e só precisa ser executado uma vez
+  seeds = list(dict.fromkeys(seeds))
 
-  futures = []
+  # Salva as seeds usadas em um arquivo para referência futura; ao retomar,
+  # as seeds anteriores são mantidas à frente das novas
+  write_seeds(seeds_path, list(dict.fromkeys(previous_seeds + seeds)))
+
+  done = completed_tasks(full_output_csv)
+
+  # Monta a lista de tarefas (script, seed) que ainda não foram executadas
+  all_tasks = [(script, seed) for seed in seeds for script in scripts]
+  tasks = [(script, seed) for script, seed in all_tasks
+           if (os.path.basename(script), seed) not in done]
+  skipped = len(all_tasks) - len(tasks)
+  if skipped:
+    print(f"Skipping {skipped} (script, seed) pairs already completed")
+  for script, seed in tasks:
+    print(f"Running {script} with seed {seed}")
+  task_scripts = [script for script, _ in tasks]
+  task_seeds = [seed for _, seed in tasks]
+
+  # Resultados devolvidos pelos workers, acumulados em um array estruturado
+  # pré-alocado (nenhum CSV é gravado durante a execução)
+  rows = np.empty(len(tasks), dtype=result_record(scripts))
+
+  # Cada worker executa as simulações no próprio processo, então um worker
+  # por núcleo basta; com poucas tarefas, não cria workers que ficariam
+  # ociosos (cada um importa todos os scripts ao iniciar)
+  if max_workers is None:
+    max_workers = available_cores()
+  max_workers = max(1, min(max_workers, len(tasks)))
+  # Cerca de quatro lotes por worker: poucas mensagens entre processos, mas
+  # ainda com lotes pequenos o bastante para equilibrar a carga no final
+  chunksize = max(1, len(tasks) // (4 * max_workers))
+  completed = 0
   try:
-    # Cria um pool de processos para execução paralela
-    with ProcessPoolExecutor() as executor:
-      # Para cada seed e cada script, agenda a execução
-      for seed in seeds:
-        for script in scripts:
-          print(f"Running {script} with seed {seed}")
-          futures.append(executor.submit(
-              run_script, script, seed, full_output_csv))
-
-      # Aguarda a conclusão de todas as execuções agendadas
-      for future in as_completed(futures):
-        future.result()
+    # Cria um pool de processos persistentes para execução paralela; cada
+    # worker importa todos os scripts ao iniciar e os executa em sequência
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=worker_context(),
+                             initializer=init_worker,
+                             initargs=(scripts,)) as executor:
+      # Envia as tarefas em lotes para reduzir o custo de comunicação
+      results = executor.map(run_script, task_scripts, task_seeds,
+                             chunksize=chunksize)
+
+      # Coleta os resultados conforme as execuções são concluídas
+      for row in results:
+        if row is None:
+          continue
+        try:
+          rows[completed] = row
+        except (OverflowError, ValueError):
+          # Uma linha que não cabe no registro é descartada sem perder os
+          # resultados das demais execuções
+          print(f"Discarding result that does not fit the CSV columns: "
+                f"{row}\n{traceback.format_exc()}", flush=True)
+          continue
+        completed += 1
 
   except KeyboardInterrupt:
     # Trata interrupção do usuário (Ctrl+C)
@@ -99,130 +533,570 @@ def run_comparison(scripts, num_runs, output_csv, custom_seeds=None):
     raise  # Re-lança a exceção para notificar o usuário
 
   finally:
+    new_rows = rows[:completed]
+    has_results = completed > 0 or os.path.exists(full_output_csv)
+
     # Após todas execuções (ou interrupção), processa os resultados
-    if os.path.exists(full_output_csv):
-      print("Generating results with collected data...")
-      plot_results(full_output_csv, results_dir)
+    if not has_results:
+      print("No output CSV generated. Skipping results generation.")
+    elif plot:
+      # Os gráficos usam os resultados já em memória (sem reler o CSV),
+      # enquanto o CSV é gravado em segundo plano
+      df = results_frame(new_rows, full_output_csv)
+      with ThreadPoolExecutor(max_workers=1) as writer:
+        saving = writer.submit(save_results, new_rows, full_output_csv)
+        print("Generating results with collected data...")
+        plot_results(results_dir, df=df, script_order=scripts,
+                     plots=plots)
+        saving.result()
+    else:
+      # Grava de uma só vez os resultados das execuções concluídas
+      save_results(new_rows, full_output_csv)
+      print(f"Plotting skipped. Results saved at {full_output_csv}")
 
+    if has_results:
       # Copia os scripts comparados para referência futura
       scripts_dir = os.path.join(results_dir, "scripts_compared")
       os.makedirs(scripts_dir, exist_ok=True)
       for script in scripts:
         try:
-          shutil.copy2(script, scripts_dir)
+          copy_script(script, scripts_dir)
         except Exception as e:
           print(f"Warning: Could not copy script {script}: {e}")
-    else:
-      print("No output CSV generated. Skipping results generation.")
 
 
-def plot_results(csv_file, results_dir):
+def plot_grouped_bars(ax, wide, colors):
+  """
+  Desenha um gráfico de barras agrupadas (uma barra por script em cada seed)
+  com uma única chamada a ax.bar.
+
+  Parâmetros:
+      ax (Axes): Eixo onde o gráfico será desenhado
+      wide (DataFrame): Tabela com seeds nas linhas e scripts nas colunas
+      colors (list): Lista de cores, uma por script
+  """
+  from matplotlib.patches import Patch  # Para montar a legenda manualmente
+
+  n_seeds, n_scripts = wide.shape
+  width = 0.5 / n_scripts
+  # Posições de todas as barras: cada seed é deslocada de acordo com o script
+  offsets = (np.arange(n_scripts) - (n_scripts - 1) / 2) * width
+  x = np.arange(n_seeds)[:, None] + offsets
+  bar_colors = [colors[i] for i in np.tile(np.arange(n_scripts), n_seeds)]
+  ax.bar(x.ravel(), wide.to_numpy().ravel(), width=width, color=bar_colors)
+
+  ax.set_xticks(np.arange(n_seeds))
+  ax.set_xticklabels(wide.index, rotation=90)
+  ax.set_xlabel(wide.index.name)
+  ax.legend(handles=[Patch(color=c) for c in colors],
+            labels=list(wide.columns), title='Script')
+
+
+def seed_script_tables(grouped, metrics):
+  """
+  Monta, para cada métrica, uma tabela com seeds nas linhas e scripts nas
+  colunas.
+
+  Como apenas seeds completas chegam aqui, o produto (Seed, Script) é denso:
+  basta ordenar uma vez e remodelar os valores, sem o hash do pivot. Se houver
+  lacunas, usa pivot_table como alternativa.
+
+  Parâmetros:
+      grouped (DataFrame): Dados agrupados por Script e Seed
+      metrics (list): Colunas a serem transformadas em tabela
+
+  Retorna:
+      dict: Tabela (DataFrame seeds x scripts) de cada métrica
+  """
+  import pandas as pd  # Para montar as tabelas
+
+  n_seeds = grouped['Seed'].nunique()
+  n_scripts = grouped['Script'].nunique()
+  if len(grouped) != n_seeds * n_scripts:
+    wide = grouped.pivot_table(index='Seed', columns='Script', values=metrics)
+    return {metric: wide[metric] for metric in metrics}
+
+  ordered = grouped.sort_values(['Seed', 'Script'])
+  seeds = pd.Index(ordered['Seed'].to_numpy()[::n_scripts], name='Seed')
+  scripts = pd.Index(ordered['Script'].to_numpy()[:n_scripts], name='Script')
+  return {
+      metric: pd.DataFrame(
+          ordered[metric].to_numpy().reshape(n_seeds, n_scripts),
+          index=seeds, columns=scripts)
+      for metric in metrics
+  }
+
+
+def script_colors(scripts):
+  """
+  Associa cada script a uma cor do ciclo de cores atual do matplotlib, para
+  que um script tenha sempre a mesma cor em todos os gráficos.
+
+  Parâmetros:
+      scripts (list): Nomes dos scripts, na ordem dos gráficos
+
+  Retorna:
+      dict: Cor de cada script
+  """
+  import matplotlib  # Para o ciclo de cores padrão
+
+  cycle = matplotlib.rcParams['axes.prop_cycle'].by_key()['color']
+  return {script: cycle[i % len(cycle)] for i, script in enumerate(scripts)}
+
+
+def plot_average_bars(ax, averages):
+  """
+  Desenha um gráfico de barras simples com um valor médio por script.
+
+  Parâmetros:
+      ax (Axes): Eixo onde o gráfico será desenhado
+      averages (Series): Valores médios indexados pelo nome do script
+  """
+  x = np.arange(len(averages))
+  ax.bar(x, averages.to_numpy(), width=0.5, color='skyblue')
+  ax.set_xticks(x)
+  ax.set_xticklabels(averages.index, rotation=90)
+  ax.set_xlabel('Script')
+
+
+def plot_cache_key(data, *labels):
+  """
+  Calcula a chave de cache de um gráfico a partir dos dados, dos rótulos, do
+  código deste script, da versão do matplotlib e dos rcParams ativos (estilo,
+  DPI, fontes...): qualquer mudança em um deles invalida o cache.
+
+  Parâmetros:
+      data (DataFrame ou Series): Dados usados no gráfico
+      *labels: Demais informações que alteram o gráfico (título, arquivo...)
+
+  Retorna:
+      str: Chave hexadecimal do gráfico
+  """
+  import matplotlib  # Para a versão e a configuração ativa de renderização
+  import pandas as pd  # Para calcular o hash dos dados
+
+  digest = hashlib.blake2b(digest_size=16)
+  with open(__file__, 'rb') as f:
+    digest.update(f.read())
+  digest.update(matplotlib.__version__.encode())
+  digest.update(repr(sorted(matplotlib.rcParams.items())).encode())
+  for label in labels:
+    digest.update(repr(label).encode())
+  digest.update(repr(list(getattr(data, 'columns', []))).encode())
+  digest.update(pd.util.hash_pandas_object(data).to_numpy().tobytes())
+  return digest.hexdigest()
+
+
+def render_cached(key, path, render):
+  """
+  Gera um PNG apenas se um gráfico com a mesma chave ainda não estiver no
+  cache; se estiver, o arquivo em cache é ligado (ou copiado) para o destino.
+
+  Parâmetros:
+      key (str): Chave do gráfico (ver plot_cache_key)
+      path (str): Caminho do arquivo PNG a ser gerado
+      render (callable): Função que gera o gráfico, chamada como render(path)
+  """
+  cache_path = os.path.join(PLOT_CACHE_DIR, f"{key}.png")
+  if os.path.exists(path):
+    os.remove(path)
+  if os.path.exists(cache_path):
+    try:
+      os.link(cache_path, path)
+    except OSError:
+      clone_file(cache_path, path)
+    return
+
+  render(path)
+  # Falhas ao gravar o cache não afetam o gráfico gerado; a cópia passa por
+  # um arquivo temporário, então o cache nunca guarda um PNG pela metade
+  try:
+    os.makedirs(PLOT_CACHE_DIR, exist_ok=True)
+    try:
+      os.link(path, cache_path)
+    except OSError:
+      clone_file(path, cache_path)
+  except OSError:
+    pass
+
+
+def render_plot(draw, data, title, ylabel, path):
+  """
+  Renderiza um gráfico em uma figura própria e o salva como PNG. Não usa o
+  estado global do pyplot, portanto pode ser chamada em paralelo por threads.
+
+  Parâmetros:
+      draw (callable): Função de desenho, chamada como draw(ax, data)
+      data: Dados do gráfico
+      title (str): Título do gráfico
+      ylabel (str): Rótulo do eixo y
+      path (str): Caminho do arquivo PNG a ser gerado
+  """
+  from matplotlib.figure import Figure  # Figura sem o estado global do pyplot
+  from matplotlib.backends.backend_agg import FigureCanvasAgg  # Renderização PNG
+
+  fig = Figure(figsize=(12, 6), dpi=80)
+  canvas = FigureCanvasAgg(fig)
+  # Margens fixas no lugar do tight_layout (espaço para os rótulos verticais
+  # do eixo x e para o título de duas linhas)
+  fig.subplots_adjust(**PLOT_MARGINS)
+  ax = fig.add_subplot()
+  draw(ax, data)
+  ax.set_title(title)
+  ax.set_ylabel(ylabel)
+  # Compressão rápida: os PNGs são artefatos de cada execução
+  canvas.print_png(path, pil_kwargs={'compress_level': 1})
+
+
+def prepare_results(df, script_order=None):
+  """
+  Prepara os resultados para os gráficos, mantendo apenas as seeds que foram
+  executadas em todos os scripts para garantir comparação justa.
+
+  Parâmetros:
+      df (DataFrame): Resultados lidos do CSV ou acumulados em memória
+      script_order (list, opcional): Ordem dos scripts nos gráficos
+
+  Retorna:
+      tuple: (filtered_df, grouped, complete_seeds), ou None se nenhuma seed
+          foi executada em todos os scripts
+  """
+  # Mantém os scripts na ordem em que foram passados na linha de comando
+  # (os que não estiverem na lista vão para o final)
+  if script_order:
+    present = set(df['Script'].cat.categories)
+    names = [os.path.basename(script) for script in script_order]
+    names = [name for name in dict.fromkeys(names) if name in present]
+    names += sorted(present.difference(names))
+    df['Script'] = df['Script'].cat.set_categories(names, ordered=True)
+
+  # Encontra as seeds completas (que foram executadas em todos os scripts)
+  # em uma única passada: o número de scripts de cada seed é propagado de
+  # volta para as linhas como máscara (o resultado é alinhado às linhas, então
+  # as seeds não precisam ser ordenadas)
+  num_scripts = df['Script'].nunique()
+  complete = df.groupby('Seed', sort=False)['Script'].transform(
+      'nunique').eq(num_scripts)
+  filtered_df = df[complete.to_numpy()].copy()
+
+  if filtered_df.empty:
+    return None
+
+  complete_seeds = np.sort(filtered_df['Seed'].unique()).tolist()
+
+  # Razão Score/Steps (eficiência) de cada execução, calculada uma única vez
+  # sobre os dados brutos (execuções sem passos resultam em NaN)
+  with np.errstate(divide='ignore', invalid='ignore'):
+    filtered_df['Score/Steps'] = np.divide(
+        filtered_df['Score'].to_numpy(), filtered_df['Steps'].to_numpy(),
+        dtype=np.float32)
+
+  # Agrupa os dados por Script e Seed, calculando médias apenas das
+  # colunas numéricas de interesse
+  grouped = filtered_df.groupby(
+      ['Script', 'Seed'], as_index=False, sort=False, observed=True
+  ).agg({'Score': 'mean', 'Steps': 'mean', 'Deliveries': 'mean',
+         'Score/Steps': 'mean'})
+
+  return filtered_df, grouped, complete_seeds
+
+
+def plot_basic(results_dir, filtered_df, grouped, complete_seeds):
+  """
+  Gera os gráficos de barras comparativos (pasta plots) e salva os dados
+  processados e a lista de seeds completas usadas.
+
+  Parâmetros:
+      results_dir (str): Diretório da execução onde os gráficos são salvos
+      filtered_df (DataFrame): Execuções das seeds completas
+      grouped (DataFrame): Médias por script e seed
+      complete_seeds (list): Seeds executadas em todos os scripts
+  """
+  print(f"Using only seeds completed for all scripts: {complete_seeds}")
+
+  # Cria subdiretório para os gráficos
+  plots_dir = os.path.join(results_dir, "plots")
+  os.makedirs(plots_dir, exist_ok=True)
+
+  # Tabelas (seeds x scripts) das três métricas comparadas
+  wide = seed_script_tables(grouped, ['Score', 'Steps', 'Score/Steps'])
+  color_map = script_colors(filtered_df['Script'].cat.categories)
+  colors = [color_map[script] for script in wide['Score'].columns]
+
+  # Média do Score/Steps Ratio por Script
+  avg_ratio = grouped.groupby('Script', observed=True)['Score/Steps'].mean()
+
+  # Gráficos gerados: (desenho, dados, título, eixo y, arquivo, descrição)
+  grouped_bars = partial(plot_grouped_bars, colors=colors)
+  subtitle = '\n(Only seeds completed for all scripts)'
+  plots = [
+      # 1. Gráfico de Scores (pontuações)
+      (grouped_bars, wide['Score'], 'Comparison of Scores by Script',
+       'Score', "score.png", "Score"),
+      # 2. Gráfico de Steps (passos/etapas)
+      (grouped_bars, wide['Steps'], 'Comparison of Steps by Script',
+       'Steps', "steps.png", "Steps"),
+      # 3. Gráfico de Score/Steps Ratio (eficiência)
+      (grouped_bars, wide['Score/Steps'],
+       'Comparison of Score/Steps Ratio by Script', 'Score/Steps Ratio',
+       "score_steps_ratio.png", "Score/Steps Ratio"),
+      # 4. Gráfico de Média do Score/Steps Ratio por Script
+      (plot_average_bars, avg_ratio, 'Average Score/Steps Ratio by Script',
+       'Average Score/Steps Ratio', "average_score_steps_ratio.png",
+       "Average Score/Steps Ratio"),
+  ]
+
+  # Os gráficos são independentes: cada thread renderiza a sua própria
+  # figura (a rasterização do Agg e a compressão PNG liberam o GIL); os que
+  # já estiverem no cache são apenas ligados ao diretório da execução
+  with ThreadPoolExecutor(max_workers=len(plots)) as pool:
+    futures = []
+    for draw, data, title, ylabel, filename, _ in plots:
+      path = os.path.join(plots_dir, filename)
+      key = plot_cache_key(data, title + subtitle, ylabel, filename)
+      render = partial(render_plot, draw, data, title + subtitle, ylabel)
+      futures.append(pool.submit(render_cached, key, path, render))
+    for future, (*_, filename, label) in zip(futures, plots):
+      future.result()
+      print(f"{label} graph saved at {os.path.join(plots_dir, filename)}")
+
+  # Salva os dados processados para referência
+  processed_data_path = os.path.join(results_dir, "processed_data.csv")
+  grouped.to_csv(processed_data_path, index=False)
+  print(f"Processed data saved at {processed_data_path}")
+
+  # Salva também as seeds completas usadas
+  complete_seeds_path = os.path.join(results_dir, "complete_seeds_used.txt")
+  write_seeds(complete_seeds_path, complete_seeds)
+  print(f"Complete seeds list saved at {complete_seeds_path}")
+
+
+def plot_advanced(results_dir, filtered_df, grouped, complete_seeds):
+  """
+  Gera as visualizações de análise (pasta analysis_plots): distribuições,
+  dispersão com regressão, heatmap de métricas e scores por seed.
+
+  Parâmetros:
+      results_dir (str): Diretório da execução onde os gráficos são salvos
+      filtered_df (DataFrame): Execuções das seeds completas
+      grouped (DataFrame): Médias por script e seed
+      complete_seeds (list): Seeds executadas em todos os scripts
+  """
+  import matplotlib  # Para aplicar o estilo dos gráficos
+  from matplotlib.figure import Figure  # Figura sem o estado global do pyplot
+  from matplotlib.backends.backend_agg import FigureCanvasAgg  # Renderização PNG
+
+  print(f"Using {len(complete_seeds)} complete seeds for analysis")
+
+  # Estilo aplicado apenas enquanto estes gráficos são gerados
+  with matplotlib.rc_context(ANALYSIS_PLOT_RC):
+    # Configurações de visualização
+    plots_dir = os.path.join(results_dir, "analysis_plots")
+    os.makedirs(plots_dir, exist_ok=True)
+    script_names = list(filtered_df['Script'].cat.categories)
+    num_scripts = len(script_names)
+    # Cores definidas uma única vez (dentro do estilo, que troca o ciclo)
+    color_map = script_colors(script_names)
+
+    # Amostras de cada script, separadas uma única vez para todos os gráficos
+    samples = {script: frame for script, frame in
+               filtered_df.groupby('Script', observed=True)}
+
+    # =====================================================================
+    # VISUALIZAÇÕES PRINCIPAIS (com tratamento de erro individual)
+    # =====================================================================
+
+    def safe_plot(draw, filename, figsize=None):
+      """
+      Renderiza um gráfico em uma figura própria (sem o estado global do
+      pyplot, podendo rodar em paralelo) e o salva, reaproveitando o cache
+      quando os dados são os mesmos; uma falha é exibida sem interromper os
+      demais gráficos.
+      """
+      def render(path):
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        draw(fig)
+        fig.tight_layout()
+        fig.savefig(path, dpi=ANALYSIS_PLOT_DPI,
+                    pil_kwargs={'compress_level': 1})
+
+      try:
+        key = plot_cache_key(filtered_df, filename, script_names)
+        render_cached(key, os.path.join(plots_dir, filename), render)
+        return f"Generated {filename}"
+      except Exception as e:
+        return f"Failed to generate {filename}: {str(e)}"
+    def column_by_script(column):
+      """Valores de uma coluna para cada script (sem NaN)"""
+      values = [samples[script][column].to_numpy() for script in script_names]
+      return [v[~np.isnan(v)] for v in values]
+
+    def distributions(fig):
+      """Boxplot dos scores e violin plot da eficiência, lado a lado"""
+      ax_box, ax_violin = fig.subplots(1, 2)
+      positions = np.arange(num_scripts)
+
+      boxes = ax_box.boxplot(column_by_script('Score'), positions=positions,
+                             widths=0.6, patch_artist=True,
+                             medianprops={'color': '0.25'})
+      for box, script in zip(boxes['boxes'], script_names):
+        box.set_facecolor(color_map[script])
+      ax_box.set_ylabel('Score')
+
+      violins = ax_violin.violinplot(column_by_script('Score/Steps'),
+                                     positions=positions, showmedians=True)
+      for body, script in zip(violins['bodies'], script_names):
+        body.set_facecolor(color_map[script])
+        body.set_alpha(0.8)
+      for part in ('cmins', 'cmaxes', 'cbars', 'cmedians'):
+        violins[part].set_color('0.25')
+      ax_violin.set_ylabel('Score/Steps')
+
+      for ax in (ax_box, ax_violin):
+        ax.set_xticks(positions)
+        ax.set_xticklabels(script_names)
+        ax.set_xlabel('Script')
+
+    def steps_vs_score(fig):
+      """Dispersão com uma reta de regressão por script"""
+      ax = fig.add_subplot()
+      per_script = max(1, SCATTER_MAX_POINTS // num_scripts)
+      rng = np.random.default_rng(0)
+      for script, color in color_map.items():
+        steps = samples[script]['Steps'].to_numpy()
+        score = samples[script]['Score'].to_numpy()
+        shown = slice(None)
+        if len(steps) > per_script:
+          shown = rng.choice(len(steps), per_script, replace=False)
+        ax.scatter(steps[shown], score[shown], color=color, alpha=0.8,
+                   label=script)
+        if np.unique(steps).size > 1:
+          slope, intercept = np.polyfit(steps, score, 1)
+          line = np.array([steps.min(), steps.max()])
+          ax.plot(line, slope * line + intercept, color=color)
+      ax.set_xlabel('Steps')
+      ax.set_ylabel('Score')
+      ax.legend(title='Script')
+
+    def metrics_comparison(fig):
+      """Heatmap das médias de cada métrica por script"""
+      ax = fig.add_subplot()
+      metrics = filtered_df.groupby('Script', observed=True)[
+          ['Score', 'Steps', 'Score/Steps']].mean().T
+      values = metrics.to_numpy()
+      image = ax.imshow(values, cmap='Blues', aspect='auto')
+      fig.colorbar(image, ax=ax)
+      # Cor do texto de cada célula (branco sobre as cores escuras),
+      # normalizando a matriz inteira de uma só vez
+      text_colors = np.where(image.norm(values) > 0.6, 'white', 'black')
+      for (row, col), value in np.ndenumerate(values):
+        ax.text(col, row, f"{value:.1f}", ha='center', va='center',
+                color=text_colors[row, col])
+      ax.set_xticks(np.arange(values.shape[1]))
+      ax.set_xticklabels(metrics.columns)
+      ax.set_yticks(np.arange(values.shape[0]))
+      ax.set_yticklabels(metrics.index)
+      ax.set_xlabel('Script')
+      ax.grid(False)
+      ax.set_title("Métricas Comparativas")
+
+    def scores_by_seed(fig):
+      """Barras agrupadas com o score de cada script em cada seed"""
+      ax = fig.add_subplot()
+      scores = grouped.pivot(index='Seed', columns='Script', values='Score')
+      scores = scores[script_names]
+      width = 0.8 / num_scripts
+      x = np.arange(len(scores))
+      for i, (script, color) in enumerate(color_map.items()):
+        offset = (i - (num_scripts - 1) / 2) * width
+        ax.bar(x + offset, scores[script].to_numpy(), width=width,
+               color=color, label=script)
+      ax.set_xticks(x)
+      ax.set_xticklabels(scores.index)
+      ax.set_xlabel('Seed')
+      ax.set_ylabel('Score')
+      ax.legend(title='Script')
+
+    plots = [
+        # 1. Distribuições: boxplot de scores e violin plot de eficiência
+        (distributions, "1_distributions.png", (14, 5.5)),
+        # 2. Scatter plot com regressão
+        (steps_vs_score, "2_steps_vs_score.png", None),
+        # 3. Heatmap de métricas
+        (metrics_comparison, "3_metrics_comparison.png", None),
+        # 4. Gráfico de barras agrupadas
+        (scores_by_seed, "4_scores_by_seed.png", None),
+    ]
+
+    # Os gráficos são independentes: cada thread renderiza a sua própria
+    # figura (a rasterização do Agg e a compressão PNG liberam o GIL)
+    with ThreadPoolExecutor(max_workers=len(plots)) as pool:
+      for message in pool.map(lambda plot: safe_plot(*plot), plots):
+        print(message)
+
+    print(f"All generated plots saved to: {plots_dir}")
+
+
+# Conjuntos de gráficos disponíveis (opção --plots)
+PLOTTERS = {
+    'basic': plot_basic,        # Barras comparativas (pasta plots)
+    'advanced': plot_advanced,  # Visualizações de análise (pasta analysis_plots)
+}
+
+
+def plot_results(results_dir, df=None, csv_file=None, script_order=None,
+                 plots='basic'):
   """
   Gera gráficos comparativos a partir dos dados coletados, usando apenas seeds
   que foram executadas em todos os scripts para garantir comparação justa.
+
+  Parâmetros:
+      results_dir (str): Diretório da execução onde os gráficos são salvos
+      df (DataFrame, opcional): Resultados já em memória
+      csv_file (str, opcional): CSV de resultados (usado quando df não é
+          passado; exatamente um dos dois deve ser informado)
+      script_order (list, opcional): Ordem dos scripts nos gráficos
+      plots (str): Conjunto de gráficos gerado ('basic' ou 'advanced')
   """
+  if (df is None) == (csv_file is None):
+    raise ValueError("plot_results expects exactly one of df or csv_file")
+  if plots not in PLOTTERS:
+    raise ValueError(f"Unknown plot set: {plots}")
+
+  import matplotlib  # Para criação de gráficos
+  matplotlib.use('Agg')  # Backend sem interface gráfica (apenas gera PNGs)
+
   try:
-      # Lê os dados do arquivo CSV
-    df = pd.read_csv(csv_file)
+    # Lê os dados do arquivo CSV quando não foram passados em memória
+    if df is None:
+      df = read_results(
+          csv_file, ['Script', 'Seed', 'Score', 'Steps', 'Deliveries'])
 
     if df.empty:
       print("No data found in CSV. Skipping plotting.")
       return
 
-    # Encontra as seeds completas (que foram executadas em todos os scripts)
-    script_counts = df.groupby('Seed')['Script'].nunique()
-    num_scripts = df['Script'].nunique()
-    complete_seeds = script_counts[script_counts == num_scripts].index.tolist()
-
-    if not complete_seeds:
+    prepared = prepare_results(df, script_order)
+    if prepared is None:
       print("No seeds were completed for all scripts. Skipping plotting.")
       return
 
-    print(f"Using only seeds completed for all scripts: {complete_seeds}")
-
-    # Filtra o dataframe para manter apenas seeds completas
-    filtered_df = df[df['Seed'].isin(complete_seeds)].copy()
-
-    # Cria subdiretório para os gráficos
-    plots_dir = os.path.join(results_dir, "plots")
-    os.makedirs(plots_dir, exist_ok=True)
-
-    # Agrupa os dados por Script e Seed, calculando médias
-    grouped = filtered_df.groupby(['Script', 'Seed']).mean().reset_index()
-
-    # 1. Gráfico de Scores (pontuações)
-    scores = grouped.pivot(index='Seed', columns='Script', values='Score')
-    fig, ax = plt.subplots(figsize=(12, 6))
-    scores.plot(kind='bar', ax=ax)
-    ax.set_title(
-        'Comparison of Scores by Script\n(Only seeds completed for all scripts)')
-    ax.set_ylabel('Score')
-    ax.legend(title='Script')
-    plt.tight_layout()
-    score_path = os.path.join(plots_dir, "score.png")
-    plt.savefig(score_path)
-    plt.close()
-    print(f"Score graph saved at {score_path}")
-
-    # 2. Gráfico de Steps (passos/etapas)
-    steps = grouped.pivot(index='Seed', columns='Script', values='Steps')
-    fig, ax = plt.subplots(figsize=(12, 6))
-    steps.plot(kind='bar', ax=ax)
-    ax.set_title(
-        'Comparison of Steps by Script\n(Only seeds completed for all scripts)')
-    ax.set_ylabel('Steps')
-    ax.legend(title='Script')
-    plt.tight_layout()
-    steps_path = os.path.join(plots_dir, "steps.png")
-    plt.savefig(steps_path)
-    plt.close()
-    print(f"Steps graph saved at {steps_path}")
-
-    # 3. Gráfico de Score/Steps Ratio (eficiência)
-    grouped['Score/Steps'] = grouped['Score'] / grouped['Steps']
-    ratio = grouped.pivot(index='Seed', columns='Script', values='Score/Steps')
-    fig, ax = plt.subplots(figsize=(12, 6))
-    ratio.plot(kind='bar', ax=ax)
-    ax.set_title(
-        'Comparison of Score/Steps Ratio by Script\n(Only seeds completed for all scripts)')
-    ax.set_ylabel('Score/Steps Ratio')
-    ax.legend(title='Script')
-    plt.tight_layout()
-    ratio_path = os.path.join(plots_dir, "score_steps_ratio.png")
-    plt.savefig(ratio_path)
-    plt.close()
-    print(f"Score/Steps Ratio graph saved at {ratio_path}")
-
-    # 4. Gráfico de Média do Score/Steps Ratio por Script
-    avg_ratio = grouped.groupby('Script')['Score/Steps'].mean()
-    fig, ax = plt.subplots(figsize=(12, 6))
-    avg_ratio.plot(kind='bar', ax=ax, color='skyblue')
-    ax.set_title(
-        'Average Score/Steps Ratio by Script\n(Only seeds completed for all scripts)')
-    ax.set_ylabel('Average Score/Steps Ratio')
-    ax.set_xlabel('Script')
-    plt.tight_layout()
-    avg_ratio_path = os.path.join(plots_dir, "average_score_steps_ratio.png")
-    plt.savefig(avg_ratio_path)
-    plt.close()
-    print(f"Average Score/Steps Ratio graph saved at {avg_ratio_path}")
-
-    # Salva os dados processados para referência
-    processed_data_path = os.path.join(results_dir, "processed_data.csv")
-    grouped.to_csv(processed_data_path, index=False)
-    print(f"Processed data saved at {processed_data_path}")
-
-    # Salva também as seeds completas usadas
-    complete_seeds_path = os.path.join(results_dir, "complete_seeds_used.txt")
-    with open(complete_seeds_path, 'w') as f:
-      f.write("\n".join(map(str, complete_seeds)) + "\n")
-    print(f"Complete seeds list saved at {complete_seeds_path}")
+    PLOTTERS[plots](results_dir, *prepared)
 
   except Exception as e:
     print(f"Error while plotting results: {e}")
+    traceback.print_exc()
 
 
-if __name__ == "__main__":
+def main(default_plots='basic'):
+  """
+  Processa os argumentos da linha de comando e executa a comparação.
+
+  Parâmetros:
+      default_plots (str): Conjunto de gráficos usado quando --plots não é
+          informado
+  """
   # Configura o parser de argumentos da linha de comando
   parser = argparse.ArgumentParser(
       description="Compare multiple delivery bot scripts",
@@ -233,10 +1107,20 @@ if __name__ == "__main__":
                       help="Scripts to compare (e.g. algo1.py algo2.py)")
   parser.add_argument("--runs", type=int, default=5,
                       help="Number of runs when using random seeds")
-  parser.add_argument("--seeds", type=lambda s: [int(item) for item in s.split(',')],
+  parser.add_argument("--seeds", type=parse_seeds,
                       help="Comma-separated list of seeds to use (overrides --runs)")
   parser.add_argument("--output", default="comparison.csv",
                       help="Output CSV file name (will be saved in the run folder)")
+  parser.add_argument("--resume", metavar="RUN_DIR",
+                      help="Results folder of a previous run to resume (skips script/seed pairs already in its CSV)")
+  parser.add_argument("--meta-seed", "--master-seed", dest="meta_seed", type=int,
+                      help="Seed for generating the random seeds (makes --runs reproducible)")
+  parser.add_argument("--workers", type=int,
+                      help="Number of parallel worker processes (default: one per available core)")
+  parser.add_argument("--plots", choices=list(PLOTTERS), default=default_plots,
+                      help="Plot set to generate: bar charts (basic) or analysis plots (advanced)")
+  parser.add_argument("--no-plot", action="store_true",
+                      help="Only run the scripts and save the CSV (skips plotting)")
 
   # Processa os argumentos
   args = parser.parse_args()
@@ -247,9 +1131,18 @@ if __name__ == "__main__":
         scripts=args.scripts,
         num_runs=args.runs,
         output_csv=args.output,
-        custom_seeds=args.seeds
+        custom_seeds=args.seeds,
+        resume_dir=args.resume,
+        meta_seed=args.meta_seed,
+        plot=not args.no_plot,
+        max_workers=args.workers,
+        plots=args.plots
     )
   except KeyboardInterrupt:
     print("\nExecution was interrupted by user.")
   except Exception as e:
     print(f"\nAn error occurred: {e}")
+
+
+if __name__ == "__main__":
+  main()
@@ -77,6 +77,10 @@ class DefaultPlayer(BasePlayer):
       else:
         # Procura o pacote mais próximo
         for pkg in world.packages:
+          # A distância de Manhattan nunca supera o custo do A* (cada passo
+          # custa pelo menos 1): se ela já não for menor, o A* é dispensável
+          if world.heuristic(current_pos, pkg) >= best_dist:
+            continue
           package_path, d_package = world.astar(current_pos, pkg)
           if d_package < best_dist:  # Se for mais próximo que o atual
             best_path = package_path
@@ -86,6 +90,8 @@ class DefaultPlayer(BasePlayer):
         # Se estiver carregando pacotes, verifica destinos de entrega
         if world.goals and self.cargo > 0:
           for goal in world.goals:
+            if world.heuristic(current_pos, goal) >= best_dist:
+              continue
             goal_path, d_goal = world.astar(current_pos, goal)
             if d_goal < best_dist:
               best_path = goal_path
@@ -110,6 +116,9 @@ class DefaultPlayer(BasePlayer):
         best = None
         best_dist = float('inf')
         for goal in world.goals:
+          # Descarta pelo limite inferior de Manhattan, como nos pacotes
+          if world.heuristic(current_pos, goal) >= best_dist:
+            continue
           goal_path, d_goal = world.astar(current_pos, goal)
           if d_goal < best_dist:
             best_path = goal_path
@@ -134,6 +143,22 @@ class DefaultPlayer(BasePlayer):
 
 
 class World:
+  # Imagens já carregadas e redimensionadas, compartilhadas por todas as
+  # instâncias (cada arquivo é lido do disco uma única vez por processo)
+  image_cache = {}
+
+  @classmethod
+  def load_image(cls, path, block_size):
+    """Carrega uma imagem redimensionada para o tamanho de um bloco"""
+    key = (path, block_size)
+    if key not in cls.image_cache:
+      image = pygame.image.load(path)
+      # Convertida para o formato de pixels da janela (por isso só é
+      # chamada depois de set_mode), o blit não converte a cada quadro
+      cls.image_cache[key] = pygame.transform.scale(
+          image, (block_size, block_size)).convert_alpha()
+    return cls.image_cache[key]
+
   def __init__(self, seed=None, headless=False):
     # Configurações iniciais do mundo
     self.headless = headless  # Modo sem interface gráfica
@@ -157,23 +182,26 @@ class World:
     self.generate_obstacles()
 
     # Cria lista de paredes a partir da matriz
-    self.walls = []
-    for row in range(self.maze_size):
-      for col in range(self.maze_size):
-        if self.map[row][col] == 1:
-          self.walls.append((col, row))  # Armazena posições das paredes
+    self.walls = [(col, row)
+                  for row, cells in enumerate(self.map)
+                  for col, cell in enumerate(cells) if cell == 1]
 
     # Define quantidade de itens para entrega (4-10 itens)
     self.total_items = random.randint(4, 10)
 
+    # Células já ocupadas por pacotes, metas, jogador e recarregador
+    # (conjunto de tuplas: cada verificação custa O(1), sem percorrer listas)
+    self.occupied = set()
+
     # Gera posições dos pacotes (locais de coleta)
     self.packages = []
     while len(self.packages) < self.total_items:
       x = random.randint(0, self.maze_size - 1)
       y = random.randint(0, self.maze_size - 1)
       # Garante que a posição é válida e não está ocupada
-      if self.map[y][x] == 0 and [x, y] not in self.packages:
+      if self.map[y][x] == 0 and (x, y) not in self.occupied:
         self.packages.append([x, y])
+        self.occupied.add((x, y))
 
     # Gera posições das metas (locais de entrega)
     self.goals = []
@@ -181,19 +209,30 @@ class World:
       x = random.randint(0, self.maze_size - 1)
       y = random.randint(0, self.maze_size - 1)
       # Garante posição válida e não conflitante
-      if self.map[y][x] == 0 and [x, y] not in self.goals and [x, y] not in self.packages:
+      if self.map[y][x] == 0 and (x, y) not in self.occupied:
         self.goals.append([x, y])
+        self.occupied.add((x, y))
 
     # Cria o jogador em uma posição válida
     self.player = self.generate_player()
+    self.occupied.add(tuple(self.player.position))
 
     # Posiciona a estação de recarga
     self.recharger = self.generate_recharger()
+    self.occupied.add(tuple(self.recharger))
 
     # Gera terrenos irregulares (custo maior de movimento)
     self.rough_terrains = []
     self.generate_rough_terrain()
 
+    # Caminhos já calculados pelo A*, por (início, destino): o mapa não muda
+    # depois de gerado, então a mesma busca nunca precisa ser refeita
+    self.path_cache = {}
+
+    # Vizinhos transitáveis de cada célula, preenchidos sob demanda pelo A*
+    # (o mapa não muda depois de gerado)
+    self.graph = {}
+
     # Configurações gráficas (se não for headless)
     if not self.headless:
       pygame.init()  # Inicializa o pygame
@@ -201,17 +240,9 @@ class World:
       pygame.display.set_caption("Delivery Bot")
 
       # Carrega imagens para os elementos visuais
-      self.package_image = pygame.image.load("images/cargo.png")
-      self.package_image = pygame.transform.scale(
-          self.package_image, (self.block_size, self.block_size))
-
-      self.goal_image = pygame.image.load("images/operator.png")
-      self.goal_image = pygame.transform.scale(
-          self.goal_image, (self.block_size, self.block_size))
-
-      self.recharger_image = pygame.image.load("images/charging-station.png")
-      self.recharger_image = pygame.transform.scale(
-          self.recharger_image, (self.block_size, self.block_size))
+      self.package_image = self.load_image("images/cargo.png", self.block_size)
+      self.goal_image = self.load_image("images/operator.png", self.block_size)
+      self.recharger_image = self.load_image("images/charging-station.png", self.block_size)
 
     # Define cores para os elementos (usadas se não houver imagens)
     self.rough_color = (139, 69, 19)  # Marrom para terreno irregular
@@ -219,6 +250,8 @@ class World:
     self.ground_color = (255, 255, 255)  # Branco para fundo
     self.player_color = (0, 255, 0)  # Verde para o jogador
     self.path_color = (200, 200, 0)  # Amarelo para o caminho
+    # Superfície de fundo, criada no primeiro draw_world
+    self.background = None
 
   def generate_rough_terrain(self):
     """Gera terrenos irregulares garantindo que não sobreponham outros elementos"""
@@ -230,11 +263,7 @@ class World:
       x = random.randint(0, self.maze_size - 1)
       y = random.randint(0, self.maze_size - 1)
       # Verifica se a posição é válida
-      if (self.map[y][x] == 0 and
-          [x, y] not in self.packages and
-          [x, y] not in self.goals and
-          [x, y] != self.player.position and
-              [x, y] != self.recharger):
+      if self.map[y][x] == 0 and (x, y) not in self.occupied:
         self.map[y][x] = 2  # Marca como terreno irregular
         self.rough_terrains.append((x, y))  # Adiciona à lista
       attempts += 1
@@ -275,7 +304,7 @@ class World:
       x = random.randint(0, self.maze_size - 1)
       y = random.randint(0, self.maze_size - 1)
       # Verifica se a posição é válida
-      if self.map[y][x] == 0 and [x, y] not in self.packages and [x, y] not in self.goals:
+      if self.map[y][x] == 0 and (x, y) not in self.occupied:
         return DefaultPlayer([x, y])  # Cria o jogador
 
   def generate_recharger(self):
@@ -285,9 +314,27 @@ class World:
       x = random.randint(center - 1, center + 1)
       y = random.randint(center - 1, center + 1)
       # Verifica posição válida
-      if self.map[y][x] == 0 and [x, y] not in self.packages and [x, y] not in self.goals and [x, y] != self.player.position:
+      if self.map[y][x] == 0 and (x, y) not in self.occupied:
         return [x, y]
 
+  def passable_neighbors(self, node):
+    """
+    Retorna os vizinhos transitáveis de uma célula (nó x * maze_size + y do
+    A*) e o custo de entrar em cada um, na ordem em que o A* os avalia
+    (direita, esquerda, baixo, cima)
+    """
+    x, y = divmod(node, self.maze_size)
+    edges = []
+    for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+      nx, ny = x + dx, y + dy
+      # Ignora vizinhos fora dos limites do grid e paredes
+      if (0 <= nx < self.maze_size and 0 <= ny < self.maze_size and
+              self.map[ny][nx] != 1):
+        # Custo do terreno (ROUGH_TERRAIN_COST para rough terrain, 1 para normal)
+        cost = ROUGH_TERRAIN_COST if self.map[ny][nx] == 2 else 1
+        edges.append((nx * self.maze_size + ny, cost))
+    return edges
+
   def can_move_to(self, pos):
     """Verifica se uma posição é válida para movimento"""
     x, y = pos
@@ -296,21 +343,31 @@ class World:
       return self.map[y][x] in (0, 2)  # 0 = livre, 2 = terreno irregular
     return False
 
-  def draw_world(self, path=None):
-    """Renderiza o mundo na tela"""
-    self.screen.fill(self.ground_color)  # Fundo branco
+  def render_background(self):
+    """Desenha o chão, as paredes e o rough terrain numa superfície própria"""
+    background = pygame.Surface((self.width, self.height))
+    background.fill(self.ground_color)  # Fundo branco
 
     # Desenha paredes
     for (x, y) in self.walls:
       rect = pygame.Rect(x * self.block_size, y *
                          self.block_size, self.block_size, self.block_size)
-      pygame.draw.rect(self.screen, self.wall_color, rect)
+      pygame.draw.rect(background, self.wall_color, rect)
 
     # Desenha terrenos irregulares
     for (x, y) in self.rough_terrains:
       rect = pygame.Rect(x * self.block_size, y *
                          self.block_size, self.block_size, self.block_size)
-      pygame.draw.rect(self.screen, self.rough_color, rect)
+      pygame.draw.rect(background, self.rough_color, rect)
+    return background
+
+  def draw_world(self, path=None):
+    """Renderiza o mundo na tela"""
+    # O fundo não muda durante o jogo: é desenhado uma única vez e apenas
+    # copiado para a tela a cada quadro
+    if self.background is None:
+      self.background = self.render_background()
+    self.screen.blit(self.background, (0, 0))
 
     # Desenha pacotes (usando imagem se disponível)
     for pkg in self.packages:
@@ -352,67 +409,69 @@ class World:
 
   def astar(self, start, goal):
     """Implementação do algoritmo A* para pathfinding"""
-    maze = self.map  # Referência para o mapa
-    size = self.maze_size  # Tamanho do grid
-    neighbors = [(1, 0), (-1, 0), (0, 1), (0, -1)]  # Movimentos possíveis
+    graph = self.graph  # Vizinhos de cada célula já calculados
+    size = self.maze_size
+    goal_x, goal_y = goal
+    # Cada nó é identificado por x * size + y: a ordem dos inteiros é a mesma
+    # das tuplas (x, y), então o desempate da fila de prioridade não muda
+    start = start[0] * size + start[1]
+    goal = goal_x * size + goal_y
+    key = (start, goal)
+    if key in self.path_cache:
+      return self.path_cache[key]
+
+    # Nomes usados a cada expansão, resolvidos uma única vez por busca
+    heappush, heappop = heapq.heappush, heapq.heappop
+    inf = float('inf')
 
     # Estruturas para o algoritmo A*
     close_set = set()  # Nós já avaliados
     came_from = {}  # Rastreia o caminho
-    gscore = {tuple(start): 0}  # Custo do caminho do início até cada nó
-    fscore = {tuple(start): self.heuristic(
-        start, goal)}  # Custo total estimado
-    oheap = []  # Fila de prioridade (heap)
-    # Adiciona o nó inicial
-    heapq.heappush(oheap, (fscore[tuple(start)], tuple(start)))
+    gscore = {start: 0}  # Custo do caminho do início até cada nó
+    # Fila de prioridade (f, nó); f = g + distância de Manhattan até a meta
+    oheap = [(abs(start // size - goal_x) + abs(start % size - goal_y), start)]
 
     while oheap:
-      current = heapq.heappop(oheap)[1]  # Pega o nó com menor custo
+      current = heappop(oheap)[1]  # Pega o nó com menor custo
+      # Entradas antigas de um nó já avaliado são descartadas: com a
+      # heurística de Manhattan, a primeira avaliação já tem o menor custo
+      if current in close_set:
+        continue
 
       # Se chegou ao destino, reconstrói o caminho
-      if list(current) == goal:
+      if current == goal:
         data = []
         total_cost = gscore[current]
         while current in came_from:
-          data.append(list(current))
+          data.append(list(divmod(current, size)))
           current = came_from[current]
         data.reverse()  # Inverte para ter do início ao fim
+        self.path_cache[key] = data, total_cost
         return data, total_cost  # Retorna caminho e custo total
 
       close_set.add(current)  # Marca como avaliado
+      current_g = gscore[current]
+      # Vizinhos transitáveis da célula e o custo de entrar em cada um,
+      # calculados uma única vez por mapa
+      edges = graph.get(current)
+      if edges is None:
+        edges = graph[current] = self.passable_neighbors(current)
 
       # Avalia todos os vizinhos
-      for dx, dy in neighbors:
-        neighbor = (current[0] + dx, current[1] + dy)
-
-        # Verifica se está dentro dos limites do grid
-        if 0 <= neighbor[0] < size and 0 <= neighbor[1] < size:
-          # Ignora paredes
-          if maze[neighbor[1]][neighbor[0]] == 1:
-            continue
-
-          # Calcula custo do terreno
-          terrain_cost = ROUGH_TERRAIN_COST if maze[neighbor[1]
-                                                    ][neighbor[0]] == 2 else 1
-        else:
-          continue  # Fora dos limites - ignora
-
-        # Calcula custo temporário para o vizinho
-        tentative_g = gscore[current] + terrain_cost
-
-        # Se já foi avaliado e o novo custo não é melhor, ignora
-        if neighbor in close_set and tentative_g >= gscore.get(neighbor, 0):
+      for neighbor, step_cost in edges:
+        if neighbor in close_set:
           continue
 
+        tentative_g = current_g + step_cost
         # Se encontrou um caminho melhor ou é um novo nó
-        if tentative_g < gscore.get(neighbor, float('inf')) or neighbor not in [i[1] for i in oheap]:
+        if tentative_g < gscore.get(neighbor, inf):
           came_from[neighbor] = current  # Atualiza o caminho
           gscore[neighbor] = tentative_g  # Atualiza custo real
-          fscore[neighbor] = tentative_g + \
-              self.heuristic(neighbor, goal)  # Atualiza custo estimado
-          # Adiciona à fila
-          heapq.heappush(oheap, (fscore[neighbor], neighbor))
+          nx, ny = divmod(neighbor, size)
+          heappush(oheap, (tentative_g + abs(nx - goal_x) +
+                           abs(ny - goal_y), neighbor))
 
+    self.path_cache[key] = [], float('inf')
     return [], float('inf')  # Retorna vazio se não encontrar caminho
 
 # ==========================
@@ -499,7 +558,9 @@ class Maze:
 
     # Salva resultados e finaliza
     self._save_results()
-    pygame.quit()
+    # O pygame só é inicializado no modo gráfico
+    if not self.headless:
+      pygame.quit()
 
   def _save_results(self):
     """Salva os resultados da simulação em arquivo CSV"""
@@ -65,6 +65,10 @@ class DefaultPlayer(BasePlayer):
         return package_path, world.packages[0]
       else:
         for pkg in world.packages:
+          # A distância de Manhattan nunca supera o custo do A* (cada passo
+          # custa pelo menos 1): se ela já não for menor, o A* é dispensável
+          if world.heuristic(current_pos, pkg) >= best_dist:
+            continue
           package_path, d_package = world.astar(current_pos, pkg)
           if d_package < best_dist:
             best_path = package_path
@@ -73,6 +77,8 @@ class DefaultPlayer(BasePlayer):
 
         if world.goals and self.cargo > 0:
           for goal in world.goals:
+            if world.heuristic(current_pos, goal) >= best_dist:
+              continue
             goal_path, d_goal = world.astar(current_pos, goal)
             if d_goal < best_dist:
               best_path = goal_path
@@ -93,6 +99,9 @@ class DefaultPlayer(BasePlayer):
         best = None
         best_dist = float('inf')
         for goal in world.goals:
+          # Descarta pelo limite inferior de Manhattan, como nos pacotes
+          if world.heuristic(current_pos, goal) >= best_dist:
+            continue
           goal_path, d_goal = world.astar(current_pos, goal)
           if d_goal < best_dist:
             best_path = goal_path
@@ -114,6 +123,22 @@ class DefaultPlayer(BasePlayer):
 
 
 class World:
+  # Imagens já carregadas e redimensionadas, compartilhadas por todas as
+  # instâncias (cada arquivo é lido do disco uma única vez por processo)
+  image_cache = {}
+
+  @classmethod
+  def load_image(cls, path, block_size):
+    """Carrega uma imagem redimensionada para o tamanho de um bloco"""
+    key = (path, block_size)
+    if key not in cls.image_cache:
+      image = pygame.image.load(path)
+      # Convertida para o formato de pixels da janela (por isso só é
+      # chamada depois de set_mode), o blit não converte a cada quadro
+      cls.image_cache[key] = pygame.transform.scale(
+          image, (block_size, block_size)).convert_alpha()
+    return cls.image_cache[key]
+
   def __init__(self, seed=None, headless=False):
     self.headless = headless
     if seed is not None:
@@ -139,37 +164,51 @@ class World:
     # Geração de obstáculos com padrão de linha (assembly line)
     self.generate_obstacles()
     # Gera a lista de paredes a partir da matriz
-    self.walls = []
-    for row in range(self.maze_size):
-      for col in range(self.maze_size):
-        if self.map[row][col] == 1:
-          self.walls.append((col, row))
+    self.walls = [(col, row)
+                  for row, cells in enumerate(self.map)
+                  for col, cell in enumerate(cells) if cell == 1]
 
     # Número total de itens (pacotes) a serem entregues
     self.total_items = random.randint(4, 10)
 
+    # Células já ocupadas por pacotes, metas, jogador e recarregador
+    # (conjunto de tuplas: cada verificação custa O(1), sem percorrer listas)
+    self.occupied = set()
+
     # Geração dos locais de coleta (pacotes)
     self.packages = []
     # Aqui geramos 5 locais para coleta, garantindo uma opção extra
     while len(self.packages) < self.total_items:
       x = random.randint(0, self.maze_size - 1)
       y = random.randint(0, self.maze_size - 1)
-      if self.map[y][x] == 0 and [x, y] not in self.packages:
+      if self.map[y][x] == 0 and (x, y) not in self.occupied:
         self.packages.append([x, y])
+        self.occupied.add((x, y))
 
     # Geração dos locais de entrega (metas)
     self.goals = []
     while len(self.goals) < self.total_items:
       x = random.randint(0, self.maze_size - 1)
       y = random.randint(0, self.maze_size - 1)
-      if self.map[y][x] == 0 and [x, y] not in self.goals and [x, y] not in self.packages:
+      if self.map[y][x] == 0 and (x, y) not in self.occupied:
         self.goals.append([x, y])
+        self.occupied.add((x, y))
 
     # Cria o jogador usando a classe DefaultPlayer (pode ser substituído por outra implementação)
     self.player = self.generate_player()
+    self.occupied.add(tuple(self.player.position))
 
     # Coloca o recharger (recarga de bateria) próximo ao centro (região 3x3)
     self.recharger = self.generate_recharger()
+    self.occupied.add(tuple(self.recharger))
+
+    # Caminhos já calculados pelo A*, por (início, destino): o mapa não muda
+    # depois de gerado, então a mesma busca nunca precisa ser refeita
+    self.path_cache = {}
+
+    # Vizinhos transitáveis de cada célula, preenchidos sob demanda pelo A*
+    # (o mapa não muda depois de gerado)
+    self.graph = {}
 
     if not self.headless:
       # Inicializa a janela do Pygame
@@ -178,23 +217,17 @@ class World:
       pygame.display.set_caption("Delivery Bot")
 
       # Carrega imagens para pacote, meta e recharger a partir de arquivos
-      self.package_image = pygame.image.load("images/cargo.png")
-      self.package_image = pygame.transform.scale(
-          self.package_image, (self.block_size, self.block_size))
-
-      self.goal_image = pygame.image.load("images/operator.png")
-      self.goal_image = pygame.transform.scale(
-          self.goal_image, (self.block_size, self.block_size))
-
-      self.recharger_image = pygame.image.load("images/charging-station.png")
-      self.recharger_image = pygame.transform.scale(
-          self.recharger_image, (self.block_size, self.block_size))
+      self.package_image = self.load_image("images/cargo.png", self.block_size)
+      self.goal_image = self.load_image("images/operator.png", self.block_size)
+      self.recharger_image = self.load_image("images/charging-station.png", self.block_size)
 
     # Cores utilizadas para desenho (caso a imagem não seja usada)
     self.wall_color = (100, 100, 100)
     self.ground_color = (255, 255, 255)
     self.player_color = (0, 255, 0)
     self.path_color = (200, 200, 0)
+    # Superfície de fundo, criada no primeiro draw_world
+    self.background = None
 
   def generate_obstacles(self):
     """
@@ -236,7 +269,7 @@ class World:
     while True:
       x = random.randint(0, self.maze_size - 1)
       y = random.randint(0, self.maze_size - 1)
-      if self.map[y][x] == 0 and [x, y] not in self.packages and [x, y] not in self.goals:
+      if self.map[y][x] == 0 and (x, y) not in self.occupied:
         return DefaultPlayer([x, y])
 
   def generate_recharger(self):
@@ -245,22 +278,48 @@ class World:
     while True:
       x = random.randint(center - 1, center + 1)
       y = random.randint(center - 1, center + 1)
-      if self.map[y][x] == 0 and [x, y] not in self.packages and [x, y] not in self.goals and [x, y] != self.player.position:
+      if self.map[y][x] == 0 and (x, y) not in self.occupied:
         return [x, y]
 
+  def passable_neighbors(self, node):
+    """
+    Retorna os vizinhos transitáveis de uma célula (nó x * maze_size + y do
+    A*) e o custo de entrar em cada um, na ordem em que o A* os avalia
+    (direita, esquerda, baixo, cima)
+    """
+    x, y = divmod(node, self.maze_size)
+    edges = []
+    for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+      nx, ny = x + dx, y + dy
+      # Ignora vizinhos fora dos limites do grid e paredes
+      if (0 <= nx < self.maze_size and 0 <= ny < self.maze_size and
+              self.map[ny][nx] != 1):
+        edges.append((nx * self.maze_size + ny, 1))
+    return edges
+
   def can_move_to(self, pos):
     x, y = pos
     if 0 <= x < self.maze_size and 0 <= y < self.maze_size:
       return self.map[y][x] == 0
     return False
 
-  def draw_world(self, path=None):
-    self.screen.fill(self.ground_color)
+  def render_background(self):
+    """Desenha o chão e as paredes numa superfície própria"""
+    background = pygame.Surface((self.width, self.height))
+    background.fill(self.ground_color)
     # Desenha os obstáculos (paredes)
     for (x, y) in self.walls:
       rect = pygame.Rect(x * self.block_size, y *
                          self.block_size, self.block_size, self.block_size)
-      pygame.draw.rect(self.screen, self.wall_color, rect)
+      pygame.draw.rect(background, self.wall_color, rect)
+    return background
+
+  def draw_world(self, path=None):
+    # O fundo não muda durante o jogo: é desenhado uma única vez e apenas
+    # copiado para a tela a cada quadro
+    if self.background is None:
+      self.background = self.render_background()
+    self.screen.blit(self.background, (0, 0))
     # Desenha os locais de coleta (pacotes) utilizando a imagem
     for pkg in self.packages:
       x, y = pkg
@@ -296,42 +355,65 @@ class World:
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
   
   def astar(self, start, goal):
-    maze = self.map
+    graph = self.graph
     size = self.maze_size
-    neighbors = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+    goal_x, goal_y = goal
+    # Cada nó é identificado por x * size + y: a ordem dos inteiros é a mesma
+    # das tuplas (x, y), então o desempate da fila de prioridade não muda
+    start = start[0] * size + start[1]
+    goal = goal_x * size + goal_y
+    key = (start, goal)
+    if key in self.path_cache:
+      return self.path_cache[key]
+
+    # Nomes usados a cada expansão, resolvidos uma única vez por busca
+    heappush, heappop = heapq.heappush, heapq.heappop
+    inf = float('inf')
     close_set = set()
     came_from = {}
-    gscore = {tuple(start): 0}
-    fscore = {tuple(start): self.heuristic(start, goal)}
-    oheap = []
-    heapq.heappush(oheap, (fscore[tuple(start)], tuple(start)))
+    gscore = {start: 0}
+    # Fila de prioridade (f, nó); f = g + distância de Manhattan até a meta
+    oheap = [(abs(start // size - goal_x) + abs(start % size - goal_y), start)]
+
     while oheap:
-      current = heapq.heappop(oheap)[1]
-      if list(current) == goal:
+      current = heappop(oheap)[1]
+      # Entradas antigas de um nó já avaliado são descartadas: com a
+      # heurística de Manhattan, a primeira avaliação já tem o menor custo
+      if current in close_set:
+        continue
+
+      if current == goal:
         data = []
         total_cost = gscore[current]
         while current in came_from:
-          data.append(list(current))
+          data.append(list(divmod(current, size)))
           current = came_from[current]
         data.reverse()
+        self.path_cache[key] = data, total_cost
         return data, total_cost
+
       close_set.add(current)
-      for dx, dy in neighbors:
-        neighbor = (current[0] + dx, current[1] + dy)
-        tentative_g = gscore[current] + 1
-        if 0 <= neighbor[0] < size and 0 <= neighbor[1] < size:
-          if maze[neighbor[1]][neighbor[0]] == 1:
-            continue
-        else:
-          continue
-        if neighbor in close_set and tentative_g >= gscore.get(neighbor, 0):
+      current_g = gscore[current]
+      # Vizinhos transitáveis da célula e o custo de entrar em cada um,
+      # calculados uma única vez por mapa
+      edges = graph.get(current)
+      if edges is None:
+        edges = graph[current] = self.passable_neighbors(current)
+
+      for neighbor, step_cost in edges:
+        if neighbor in close_set:
           continue
-        if tentative_g < gscore.get(neighbor, float('inf')) or neighbor not in [i[1] for i in oheap]:
+
+        tentative_g = current_g + step_cost
+        # Melhor caminho até então
+        if tentative_g < gscore.get(neighbor, inf):
           came_from[neighbor] = current
           gscore[neighbor] = tentative_g
-          fscore[neighbor] = tentative_g + self.heuristic(neighbor, goal)
-          heapq.heappush(oheap, (fscore[neighbor], neighbor))
+          nx, ny = divmod(neighbor, size)
+          heappush(oheap, (tentative_g + abs(nx - goal_x) +
+                           abs(ny - goal_y), neighbor))
 
+    self.path_cache[key] = [], float('inf')
     return [], float('inf')
 
 # ==========================
@@ -398,7 +480,9 @@ class Maze:
 
     # Gravação dos resultados
     self._save_results()
-    pygame.quit()
+    # O pygame só é inicializado no modo gráfico
+    if not self.headless:
+      pygame.quit()
 
   def _save_results(self):
     file_exists = os.path.isfile(self.output_file)
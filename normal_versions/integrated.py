@@ -121,6 +121,22 @@ class DefaultPlayer(BasePlayer):
 
 
 class World:
+  # Imagens já carregadas e redimensionadas, compartilhadas por todas as
+  # instâncias (cada arquivo é lido do disco uma única vez por processo)
+  image_cache = {}
+
+  @classmethod
+  def load_image(cls, path, block_size):
+    """Carrega uma imagem redimensionada para o tamanho de um bloco"""
+    key = (path, block_size)
+    if key not in cls.image_cache:
+      image = pygame.image.load(path)
+      # Convertida para o formato de pixels da janela (por isso só é
+      # chamada depois de set_mode), o blit não converte a cada quadro
+      cls.image_cache[key] = pygame.transform.scale(
+          image, (block_size, block_size)).convert_alpha()
+    return cls.image_cache[key]
+
   def __init__(self, seed=None):
     if seed is not None:
       random.seed(seed)
@@ -146,11 +162,9 @@ class World:
     # Geração de obstáculos com padrão de linha (assembly line)
     self.generate_obstacles()
     # Gera a lista de paredes a partir da matriz
-    self.walls = []
-    for row in range(self.maze_size):
-      for col in range(self.maze_size):
-        if self.map[row][col] == 1:
-          self.walls.append((col, row))
+    self.walls = [(col, row)
+                  for row, cells in enumerate(self.map)
+                  for col, cell in enumerate(cells) if cell == 1]
 
     # Número total de itens (pacotes) a serem entregues
     self.total_items = random.randint(4, 10)
@@ -185,23 +199,17 @@ class World:
     pygame.display.set_caption("Delivery Bot")
 
     # Carrega imagens para pacote, meta e recharger a partir de arquivos
-    self.package_image = pygame.image.load("images/cargo.png")
-    self.package_image = pygame.transform.scale(
-        self.package_image, (self.block_size, self.block_size))
-
-    self.goal_image = pygame.image.load("images/operator.png")
-    self.goal_image = pygame.transform.scale(
-        self.goal_image, (self.block_size, self.block_size))
-
-    self.recharger_image = pygame.image.load("images/charging-station.png")
-    self.recharger_image = pygame.transform.scale(
-        self.recharger_image, (self.block_size, self.block_size))
+    self.package_image = self.load_image("images/cargo.png", self.block_size)
+    self.goal_image = self.load_image("images/operator.png", self.block_size)
+    self.recharger_image = self.load_image("images/charging-station.png", self.block_size)
 
     # Cores utilizadas para desenho (caso a imagem não seja usada)
     self.wall_color = (100, 100, 100)
     self.ground_color = (255, 255, 255)
     self.player_color = (0, 255, 0)
     self.path_color = (200, 200, 0)
+    # Superfície de fundo, criada no primeiro draw_world
+    self.background = None
 
   def generate_obstacles(self):
     """
@@ -261,13 +269,23 @@ class World:
       return self.map[y][x] == 0
     return False
 
-  def draw_world(self, path=None):
-    self.screen.fill(self.ground_color)
+  def render_background(self):
+    """Desenha o chão e as paredes numa superfície própria"""
+    background = pygame.Surface((self.width, self.height))
+    background.fill(self.ground_color)
     # Desenha os obstáculos (paredes)
     for (x, y) in self.walls:
       rect = pygame.Rect(x * self.block_size, y *
                          self.block_size, self.block_size, self.block_size)
-      pygame.draw.rect(self.screen, self.wall_color, rect)
+      pygame.draw.rect(background, self.wall_color, rect)
+    return background
+
+  def draw_world(self, path=None):
+    # O fundo não muda durante o jogo: é desenhado uma única vez e apenas
+    # copiado para a tela a cada quadro
+    if self.background is None:
+      self.background = self.render_background()
+    self.screen.blit(self.background, (0, 0))
     # Desenha os locais de coleta (pacotes) utilizando a imagem
     for pkg in self.packages:
       x, y = pkg